@@ -553,6 +553,7 @@ def main():
                 config["OPENAI_API_KEY"],
                 synthesis_model,
                 report,
+                use_cache=(depth == "scan"),
             )
         except Exception as e:
             # Synthesis is optional - continue without it
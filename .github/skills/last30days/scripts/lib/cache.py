@@ -23,6 +23,12 @@ def get_cache_key(topic: str, from_date: str, to_date: str, sources: str) -> str
     return hashlib.sha256(key_data.encode()).hexdigest()[:16]
 
 
+def get_synthesis_cache_key(model: str, prompt: str) -> str:
+    """Generate a cache key from the exact synthesis request (model + full prompt)."""
+    key_data = f"{model}|{prompt}"
+    return "synth-" + hashlib.sha256(key_data.encode()).hexdigest()[:16]
+
+
 def get_cache_path(cache_key: str) -> Path:
     """Get path to cache file."""
     return CACHE_DIR / f"{cache_key}.json"
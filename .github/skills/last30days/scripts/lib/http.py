@@ -2,6 +2,7 @@
 
 import json
 import os
+import random
 import sys
 import time
 import urllib.error
@@ -22,6 +23,7 @@ def log(msg: str):
 
 MAX_RETRIES = 3
 RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 60.0
 USER_AGENT = "last30days-skill/1.0 (Claude Code Skill)"
 
 
@@ -33,6 +35,20 @@ class HTTPError(Exception):
         self.body = body
 
 
+def _retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Exponential backoff (1s, 2s, 4s, ...) plus jitter, capped at MAX_RETRY_DELAY.
+
+    A numeric Retry-After header (seconds) from a 429/503 is used as the floor.
+    """
+    delay = RETRY_DELAY * (2 ** attempt) + random.uniform(0, RETRY_DELAY)
+    if retry_after:
+        try:
+            delay = max(delay, float(retry_after))
+        except ValueError:
+            pass  # HTTP-date form — keep the computed backoff
+    return min(delay, MAX_RETRY_DELAY)
+
+
 def request(
     method: str,
     url: str,
@@ -94,12 +110,12 @@ def request(
                 raise last_error
 
             if attempt < retries - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
+                time.sleep(_retry_delay(attempt, e.headers.get("Retry-After") if e.headers else None))
         except urllib.error.URLError as e:
             log(f"URL Error: {e.reason}")
             last_error = HTTPError(f"URL Error: {e.reason}")
             if attempt < retries - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
+                time.sleep(_retry_delay(attempt))
         except json.JSONDecodeError as e:
             log(f"JSON decode error: {e}")
             last_error = HTTPError(f"Invalid JSON response: {e}")
@@ -109,7 +125,7 @@ def request(
             log(f"Connection error: {type(e).__name__}: {e}")
             last_error = HTTPError(f"Connection error: {type(e).__name__}: {e}")
             if attempt < retries - 1:
-                time.sleep(RETRY_DELAY * (attempt + 1))
+                time.sleep(_retry_delay(attempt))
 
     if last_error:
         raise last_error
@@ -3,45 +3,34 @@
 import json
 from typing import Dict, Any, List, Optional
 
-from . import http, schema
+from . import cache, http, schema
 
 OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
 
-SYNTHESIS_PROMPT = """You are a research analyst synthesizing findings from Reddit, X/Twitter, and web sources.
-
-TOPIC: {topic}
-DATE RANGE: {from_date} to {to_date}
-
-## SOURCE DATA
-
-### Reddit Threads ({reddit_count} found)
-{reddit_summary}
-
-### X Posts ({x_count} found, {x_likes} total likes, {x_reposts} total reposts)
-{x_summary}
-
-### Web Sources ({web_count} pages)
-{web_summary}
+# Static instructions go in the system message so every call shares an identical
+# prompt prefix (OpenAI caches repeated prefixes automatically). The JSON template
+# is no longer passed through str.format, so its braces are single.
+SYNTHESIS_SYSTEM = """You are a research analyst synthesizing findings from Reddit, X/Twitter, and web sources.
 
 ## YOUR TASK
 
 Generate a synthesis in EXACTLY this JSON format:
 
-{{
+{
   "what_i_learned": "2-4 flowing sentences synthesizing key insights. Use specific numbers and quotes where impactful. Connect ideas across sources. Be concrete, not generic.",
   "key_patterns": [
-    {{"name": "Pattern Name", "explanation": "Concrete actionable explanation with specifics"}},
-    {{"name": "Pattern Name", "explanation": "Concrete actionable explanation with specifics"}},
-    {{"name": "Pattern Name", "explanation": "Concrete actionable explanation with specifics"}}
+    {"name": "Pattern Name", "explanation": "Concrete actionable explanation with specifics"},
+    {"name": "Pattern Name", "explanation": "Concrete actionable explanation with specifics"},
+    {"name": "Pattern Name", "explanation": "Concrete actionable explanation with specifics"}
   ],
-  "top_voices": {{
+  "top_voices": {
     "reddit": ["subreddit1", "subreddit2"],
     "x": ["handle1", "handle2", "handle3"],
     "web": ["domain1.com", "domain2.com"]
-  }},
+  },
   "topic_summary": "A short 1-sentence summary of the topic for context storage",
   "key_findings_bullets": ["finding1", "finding2", "finding3"]
-}}
+}
 
 RULES:
 - what_i_learned should be a narrative paragraph, NOT bullet points
@@ -51,6 +40,20 @@ RULES:
 - If data is sparse, say so honestly
 - Output ONLY valid JSON, no markdown code blocks"""
 
+SYNTHESIS_USER_TEMPLATE = """TOPIC: {topic}
+DATE RANGE: {from_date} to {to_date}
+
+## SOURCE DATA
+
+### Reddit Threads ({reddit_count} found)
+{reddit_summary}
+
+### X Posts ({x_count} found, {x_likes} total likes, {x_reposts} total reposts)
+{x_summary}
+
+### Web Sources ({web_count} pages)
+{web_summary}"""
+
 
 def _summarize_reddit(items: List[schema.RedditItem], limit: int = 10) -> str:
     """Create a summary of Reddit items for synthesis."""
@@ -60,12 +63,13 @@ def _summarize_reddit(items: List[schema.RedditItem], limit: int = 10) -> str:
     lines = []
     for item in items[:limit]:
         eng = ""
-        if item.engagement:
+        engagement = item.engagement
+        if engagement:
             parts = []
-            if item.engagement.score is not None:
-                parts.append(f"{item.engagement.score}pts")
-            if item.engagement.num_comments is not None:
-                parts.append(f"{item.engagement.num_comments}cmt")
+            if engagement.score is not None:
+                parts.append(f"{engagement.score}pts")
+            if engagement.num_comments is not None:
+                parts.append(f"{engagement.num_comments}cmt")
             eng = f" [{', '.join(parts)}]" if parts else ""
         
         lines.append(f"- r/{item.subreddit}: \"{item.title}\"{eng}")
@@ -86,12 +90,13 @@ def _summarize_x(items: List[schema.XItem], limit: int = 12) -> str:
     lines = []
     for item in items[:limit]:
         eng = ""
-        if item.engagement:
+        engagement = item.engagement
+        if engagement:
             parts = []
-            if item.engagement.likes is not None:
-                parts.append(f"{item.engagement.likes}likes")
-            if item.engagement.reposts is not None:
-                parts.append(f"{item.engagement.reposts}rt")
+            if engagement.likes is not None:
+                parts.append(f"{engagement.likes}likes")
+            if engagement.reposts is not None:
+                parts.append(f"{engagement.reposts}rt")
             eng = f" [{', '.join(parts)}]" if parts else ""
         
         # Truncate long text
@@ -123,11 +128,12 @@ def _calculate_x_totals(items: List[schema.XItem]) -> tuple:
     total_likes = 0
     total_reposts = 0
     for item in items:
-        if item.engagement:
-            if item.engagement.likes:
-                total_likes += item.engagement.likes
-            if item.engagement.reposts:
-                total_reposts += item.engagement.reposts
+        eng = item.engagement
+        if eng:
+            if eng.likes:
+                total_likes += eng.likes
+            if eng.reposts:
+                total_reposts += eng.reposts
     return total_likes, total_reposts
 
 
@@ -136,6 +142,7 @@ def synthesize(
     model: str,
     report: schema.Report,
     timeout: int = 60,
+    use_cache: bool = False,
 ) -> Dict[str, Any]:
     """Synthesize research results into "What I learned" and "KEY PATTERNS".
     
@@ -144,6 +151,7 @@ def synthesize(
         model: Model to use (e.g., "gpt-4o-mini", "gpt-4o")
         report: Research report with Reddit, X, and web data
         timeout: Request timeout in seconds
+        use_cache: If True, reuse a synthesis of the identical prompt (24h TTL)
         
     Returns:
         Dict with:
@@ -157,7 +165,7 @@ def synthesize(
     x_likes, x_reposts = _calculate_x_totals(report.x)
     
     # Build prompt
-    prompt = SYNTHESIS_PROMPT.format(
+    prompt = SYNTHESIS_USER_TEMPLATE.format(
         topic=report.topic,
         from_date=report.range_from,
         to_date=report.range_to,
@@ -171,6 +179,14 @@ def synthesize(
         web_summary=_summarize_web(report.web),
     )
     
+    # Exact-match cache: a rerun over cached research builds the same prompt
+    cache_key = None
+    if use_cache:
+        cache_key = cache.get_synthesis_cache_key(model, SYNTHESIS_SYSTEM + "\n" + prompt)
+        cached = cache.load_cache(cache_key)
+        if cached:
+            return cached
+
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
@@ -179,19 +195,23 @@ def synthesize(
     payload = {
         "model": model,
         "messages": [
-            {"role": "user", "content": prompt}
+            {"role": "system", "content": SYNTHESIS_SYSTEM},
+            {"role": "user", "content": prompt},
         ],
         "response_format": {"type": "json_object"},
         "temperature": 0.7,
     }
     
     try:
-        response = http.post(OPENAI_CHAT_URL, payload, headers=headers, timeout=timeout)
+        response = http.post(OPENAI_CHAT_URL, payload, headers=headers, timeout=timeout, retries=5)
         
         # Parse response
         if "choices" in response and response["choices"]:
             content = response["choices"][0].get("message", {}).get("content", "{}")
-            return json.loads(content)
+            result = json.loads(content)
+            if cache_key:
+                cache.save_cache(cache_key, result)
+            return result
     except Exception as e:
         # Return empty synthesis on error
         return {
@@ -228,16 +248,12 @@ def generate_stats_tree(
     lines = []
     
     # Calculate totals
-    reddit_pts = sum(
-        r.engagement.score or 0 
-        for r in report.reddit 
-        if r.engagement
-    )
-    reddit_cmt = sum(
-        r.engagement.num_comments or 0 
-        for r in report.reddit 
-        if r.engagement
-    )
+    reddit_pts = reddit_cmt = 0
+    for r in report.reddit:
+        eng = r.engagement
+        if eng:
+            reddit_pts += eng.score or 0
+            reddit_cmt += eng.num_comments or 0
     x_likes, x_reposts = _calculate_x_totals(report.x)
     
     lines.append("✅ All agents reported back!")
@@ -262,7 +278,7 @@ def generate_stats_tree(
     
     # Web line
     if report.web:
-        domains = list(set(w.source_domain for w in report.web[:5]))
+        domains = list(dict.fromkeys(w.source_domain for w in report.web[:5]))
         web_str = f"├─ 🌐 Web: {len(report.web)}+ pages │ {', '.join(domains[:4])}"
         lines.append(web_str)
     
@@ -273,13 +289,13 @@ def generate_stats_tree(
     reddit_subs = top_voices.get("reddit", [])
     if reddit_subs:
         # Strip r/ prefix if already present
-        subs = [s.lstrip("r/") for s in reddit_subs[:2]]
+        subs = [s.removeprefix("r/") for s in reddit_subs[:2]]
         voice_parts.append(", ".join(f"r/{s}" for s in subs))
     
     x_handles = top_voices.get("x", [])
     if x_handles:
         # Strip @ prefix if already present
-        handles = [h.lstrip("@") for h in x_handles[:3]]
+        handles = [h.removeprefix("@") for h in x_handles[:3]]
         voice_parts.append(", ".join(f"@{h}" for h in handles))
     
     web_domains = top_voices.get("web", [])
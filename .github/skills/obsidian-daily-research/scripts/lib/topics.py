@@ -4,7 +4,6 @@ Each topic defines search queries optimized for Reddit and X discovery.
 Topics are loaded from config.json but can be overridden at runtime.
 """
 
-import json
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -168,6 +167,8 @@ DEFAULT_TOPICS: List[Topic] = [
     ),
 ]
 
+_DEFAULT_BY_SLUG: Dict[str, Topic] = {t.slug: t for t in DEFAULT_TOPICS}
+
 
 def load_topics(config: dict) -> List[Topic]:
     """Load topics from config, falling back to defaults.
@@ -188,7 +189,7 @@ def load_topics(config: dict) -> List[Topic]:
         weight = t.get("weight", 1.0)
 
         # Try to find matching default topic for its queries
-        default = next((d for d in DEFAULT_TOPICS if d.slug == slug), None)
+        default = _DEFAULT_BY_SLUG.get(slug)
         reddit_q = t.get("reddit_queries", default.reddit_queries if default else [])
         x_q = t.get("x_queries", default.x_queries if default else [])
 
@@ -6,8 +6,11 @@ daily note writing, and library management via the Obsidian CLI.
 Requires Obsidian to be running with CLI enabled.
 """
 
+import math
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Set, Tuple
 
@@ -30,6 +33,19 @@ _file_content_cache: dict[str, str] = {}
 # Vault filesystem root (set from config on first use; enables direct FS I/O)
 _vault_fs_root: str | None = None
 
+# Notes are joined with this separator and extracted in one regex pass. It
+# contains whitespace (ends URL matches) and a ']' not followed by '(' (ends
+# link-title matches without completing one), so no match spans two notes.
+_NOTE_JOIN_SEP = "\n]\n"
+# Above this many characters, extract per note instead of joining the vault
+_JOINED_SCAN_MAX_CHARS = 50_000_000
+
+# Precompiled extraction patterns (hot path: run over every vault note)
+_URL_RE = re.compile(r'https?://[^\s\)\]>\"\']+')
+# Titles: list-item links and ##–#### headers (separate passes — they can overlap)
+_LINK_TITLE_RE = re.compile(r'[-*]\s*(?:\[[ x]\]\s*)?\[([^\]]+)\]\(')
+_HEADER_TITLE_RE = re.compile(r'^#{2,4}\s+(.+)$', re.MULTILINE)
+
 
 def _client() -> Obsidian:
     """Get or create the Obsidian client singleton."""
@@ -62,7 +78,9 @@ def _init_fs(config: dict) -> None:
 def extract_urls_from_text(text: str) -> Set[str]:
     """Extract all URLs from markdown text."""
     urls: Set[str] = set()
-    for match in re.finditer(r'https?://[^\s\)\]>\"\']+', text):
+    if 'http' not in text:
+        return urls
+    for match in _URL_RE.finditer(text):
         url = match.group(0).rstrip(".,;:!?")
         urls.add(url)
     return urls
@@ -71,30 +89,75 @@ def extract_urls_from_text(text: str) -> Set[str]:
 def extract_titles_from_text(text: str) -> Set[str]:
     """Extract article titles from markdown headers and list items."""
     titles: Set[str] = set()
-    for match in re.finditer(r'[-*]\s*(?:\[[ x]\]\s*)?\[([^\]]+)\]\(', text):
+    if '[' not in text and '##' not in text:
+        return titles
+    for match in _LINK_TITLE_RE.finditer(text):
         title = match.group(1).strip().lower()
         if len(title) > 10:
             titles.add(title)
-    for match in re.finditer(r'^#{2,4}\s+(.+)$', text, re.MULTILINE):
+    for match in _HEADER_TITLE_RE.finditer(text):
         title = match.group(1).strip().lower()
         if len(title) > 10:
             titles.add(title)
     return titles
 
 
+# Inverted word index over the last frozenset passed to title_is_seen:
+# (seen_titles object, (word set, word count) entries, word → entry indexes)
+_title_index: tuple | None = None
+
+
+def _get_title_index(seen_titles: Set[str]) -> tuple[list[tuple[frozenset, int]], dict[str, list[int]]]:
+    """Return (entries, postings) for seen_titles.
+
+    Only a frozenset's index is kept for reuse; a mutable set can change in
+    place, so it is indexed afresh on every call.
+    """
+    global _title_index
+    cached = _title_index
+    if cached is not None and cached[0] is seen_titles:
+        return cached[1], cached[2]
+    word_sets: list[tuple[frozenset, int]] = []
+    postings: dict[str, list[int]] = {}
+    for seen in seen_titles:
+        seen_words = frozenset(seen.split())
+        if not seen_words:
+            continue
+        idx = len(word_sets)
+        word_sets.append((seen_words, len(seen_words)))
+        for word in seen_words:
+            postings.setdefault(word, []).append(idx)
+    if isinstance(seen_titles, frozenset):
+        _title_index = (seen_titles, word_sets, postings)
+    return word_sets, postings
+
+
 def title_is_seen(title: str, seen_titles: Set[str], threshold: float = 0.8) -> bool:
-    """Check if a title is similar enough to a seen title (word overlap)."""
+    """Check if a title is similar enough to a seen title (word overlap).
+
+    Only seen titles sharing at least one of the title's rarest words are
+    compared: a match needs ceil(threshold * n) of the n title words, so it
+    must contain one of any n - ceil(threshold * n) + 1 of them.
+    """
     if not title or not seen_titles:
         return False
-    title_words = set(title.lower().split())
+    lowered = title.lower()
+    title_words = set(lowered.split())
     if len(title_words) < 3:
-        return title.lower() in seen_titles
-    for seen in seen_titles:
-        seen_words = set(seen.split())
-        if not seen_words:
-            continue
-        overlap = len(title_words & seen_words) / max(len(title_words), len(seen_words))
-        if overlap >= threshold:
+        return lowered in seen_titles
+    word_sets, postings = _get_title_index(seen_titles)
+    n = len(title_words)
+    needed = math.ceil(threshold * n - 1e-9)
+    if needed <= 0:
+        probe = range(len(word_sets))
+    else:
+        rarest = sorted(title_words, key=lambda w: len(postings.get(w, ())))
+        probe = set()
+        for word in rarest[:n - needed + 1]:
+            probe.update(postings.get(word, ()))
+    for idx in probe:
+        seen_words, m = word_sets[idx]
+        if len(title_words & seen_words) / (m if m > n else n) >= threshold:
             return True
     return False
 
@@ -114,14 +177,15 @@ def _scan_folder_files(folder: str) -> list[str]:
 
     vault_root = _vault_fs_root
     if vault_root:
-        base = Path(vault_root) / folder
-        if base.is_dir():
-            files = sorted(
-                f"{folder}/{f.name}"
-                for f in base.iterdir()
-                if f.is_file() and f.suffix == ".md"
-            )
-        else:
+        # scandir yields cached d_type, so no per-entry stat for is_file()
+        try:
+            with os.scandir(Path(vault_root) / folder) as entries:
+                files = sorted(
+                    f"{folder}/{entry.name}"
+                    for entry in entries
+                    if entry.name.endswith(".md") and entry.is_file()
+                )
+        except OSError:
             files = []
     else:
         ob = _client()
@@ -143,10 +207,12 @@ def _read_vault_file(filepath: str) -> str:
 
     vault_root = _vault_fs_root
     if vault_root:
-        full = Path(vault_root) / filepath
+        # Open directly (a missing file is just OSError — no exists() pre-stat)
+        # and decode bytes, skipping text-mode newline translation
         try:
-            text = full.read_text(encoding="utf-8", errors="replace") if full.exists() else ""
-        except Exception:
+            with open(os.path.join(vault_root, filepath), "rb") as fh:
+                text = fh.read().decode("utf-8", errors="replace")
+        except OSError:
             text = ""
     else:
         ob = _client()
@@ -182,10 +248,21 @@ def _scan_folder_recursive(folder: str) -> list[str]:
 
     import datetime
     current_year = datetime.datetime.now().year
+    # One folder listing up front, so absent years/months cost nothing instead
+    # of a CLI spawn each (36+ probes per load, almost all of them empty)
+    subfolders = _cli_subfolders(folder, _YEAR_DIR_RE)
     for year in range(2024, current_year + 2):
         year_folder = f"{folder}/{year}"
+        if subfolders is not None and year_folder not in subfolders:
+            continue
+        month_folders = subfolders
+        if month_folders is not None and not any(f.startswith(year_folder + "/") for f in month_folders):
+            # Listing was not recursive — list this year's months directly
+            month_folders = _cli_subfolders(year_folder, _MONTH_DIR_RE)
         for month in range(1, 13):
             month_folder = f"{year_folder}/{month:02d}"
+            if month_folders is not None and month_folder not in month_folders:
+                continue
             month_files = _scan_folder_files(month_folder)
             all_files.extend(month_files)
         year_files = _scan_folder_files(year_folder)
@@ -194,19 +271,48 @@ def _scan_folder_recursive(folder: str) -> list[str]:
     return all_files
 
 
+# Child folder names the dailies layout uses (Dailies/2026/02)
+_YEAR_DIR_RE = re.compile(r'20\d\d')
+_MONTH_DIR_RE = re.compile(r'\d\d')
+
+
+def _cli_subfolders(folder: str, child_re: re.Pattern) -> set[str] | None:
+    """Vault-relative sub-folder paths under folder via one CLI call.
+
+    Returns None when the listing is unavailable or names no direct child
+    matching child_re (empty or unrecognised output), so callers probe every
+    candidate folder as before rather than skipping them all.
+    """
+    result = _client().folders(folder=folder)
+    if not result.ok:
+        return None
+    subfolders = set()
+    for line in result.lines():
+        line = line.strip().rstrip("/")
+        if not line or line.lower().startswith("error"):
+            continue
+        # Accept both vault-relative paths and bare child names
+        subfolders.add(line if line.startswith(folder + "/") else f"{folder}/{line}")
+    prefix_len = len(folder) + 1
+    if not any(child_re.fullmatch(f[prefix_len:]) for f in subfolders):
+        return None
+    return subfolders
+
+
 def _os_walk(base: Path):
     """Compatibility shim: use os.walk when Path.walk() is not available (Python <3.12)."""
-    import os
     for dirpath, dirnames, filenames in os.walk(str(base)):
         dirnames.sort()
         yield dirpath, dirnames, filenames
 
 
-def load_seen_dedup(config: dict) -> tuple[Set[str], Set[str]]:
+def load_seen_dedup(config: dict) -> tuple[frozenset[str], frozenset[str]]:
     """Scan all dailies + library notes in ONE pass, returning (seen_urls, seen_titles).
 
     Replaces separate load_seen_urls / load_seen_titles calls to halve the
-    number of Obsidian CLI file-read operations.
+    number of Obsidian CLI file-read operations. Returned as frozensets —
+    safe to share across threads without copying; callers that need to add
+    to them copy into a set.
     """
     _init_fs(config)  # enable FS-direct reads if vault_path is valid
     dailies_folder = config.get("dailies_folder", "Research/Dailies")
@@ -215,16 +321,23 @@ def load_seen_dedup(config: dict) -> tuple[Set[str], Set[str]]:
     seen_titles: Set[str] = set()
 
     all_files = list(_scan_folder_recursive(dailies_folder)) + list(_scan_folder_files(library_folder))
-    for filepath in all_files:
-        text = _read_vault_file(filepath)
-        if text:
-            seen_urls.update(extract_urls_from_text(text))
-            seen_titles.update(extract_titles_from_text(text))
+    if _vault_fs_root:
+        # Disk reads release the GIL — overlap them. The CLI path stays serial
+        # (parallel Obsidian.com spawns overload its IPC pipe).
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            texts = [text for text in pool.map(_read_vault_file, all_files) if text]
+    else:
+        texts = [text for text in map(_read_vault_file, all_files) if text]
+    if sum(map(len, texts)) <= _JOINED_SCAN_MAX_CHARS:
+        texts = [_NOTE_JOIN_SEP.join(texts)]
+    for text in texts:
+        seen_urls.update(extract_urls_from_text(text))
+        seen_titles.update(extract_titles_from_text(text))
 
-    return seen_urls, seen_titles
+    return frozenset(seen_urls), frozenset(seen_titles)
 
 
-def load_seen_urls(config: dict) -> Set[str]:
+def load_seen_urls(config: dict) -> frozenset[str]:
     """Return all previously seen URLs from dailies + library.
 
     Prefer load_seen_dedup() when you need both URLs and titles.
@@ -233,7 +346,7 @@ def load_seen_urls(config: dict) -> Set[str]:
     return urls
 
 
-def load_seen_titles(config: dict) -> Set[str]:
+def load_seen_titles(config: dict) -> frozenset[str]:
     """Return all previously seen article titles for fuzzy dedup.
 
     Prefer load_seen_dedup() when you need both URLs and titles.
@@ -251,12 +364,7 @@ def _daily_path(dailies_folder: str, date_str: str) -> str:
 
     e.g. Research/Dailies/2026/02/2026-02-26.md
     """
-    try:
-        year = date_str[:4]
-        month = date_str[5:7]
-        return f"{dailies_folder}/{year}/{month}/{date_str}.md"
-    except (IndexError, ValueError):
-        return f"{dailies_folder}/{date_str}.md"
+    return f"{dailies_folder}/{date_str[:4]}/{date_str[5:7]}/{date_str}.md"
 
 
 def write_daily_note(config: dict, date_str: str, content: str, overwrite: bool = False) -> str:
@@ -283,7 +391,7 @@ def write_daily_note(config: dict, date_str: str, content: str, overwrite: bool
         if full_path.exists() and not overwrite:
             raise FileExistsError(f"Daily note already exists: {path}")
         full_path.parent.mkdir(parents=True, exist_ok=True)
-        full_path.write_text(content, encoding="utf-8")
+        full_path.write_bytes(content.encode("utf-8"))
         # Populate cache so subsequent reads in same run don't re-read disk
         _file_content_cache[path] = content
     else:
@@ -291,10 +399,25 @@ def write_daily_note(config: dict, date_str: str, content: str, overwrite: bool
         if ob.exists(path=path) and not overwrite:
             raise FileExistsError(f"Daily note already exists: {path}")
         ob.create(path=path, content=content, overwrite=overwrite)
+        _file_content_cache.pop(path, None)  # drop any pre-write text
+    _folder_cache.pop(path.rsplit("/", 1)[0], None)  # listing now lacks the new note
 
     return path
 
 
+def read_daily_note(config: dict, date_str: str) -> str:
+    """Return the daily note for date_str, or "" if there is none.
+
+    Served from the per-process file cache, so notes the dedup scan already
+    read are not read again. Filesystem only: returns "" when vault_path is
+    not a local directory (no CLI spawn per probed date).
+    """
+    _init_fs(config)
+    if not _vault_fs_root:
+        return ""
+    return _read_vault_file(_daily_path(config.get("dailies_folder", "Research/Dailies"), date_str))
+
+
 def daily_exists(config: dict, date_str: str) -> bool:
     """Check if a daily note already exists for this date."""
     _init_fs(config)
@@ -310,21 +433,13 @@ def daily_exists(config: dict, date_str: str) -> bool:
             return True
         return False
 
-    ob = _client()
-    if ob.exists(path=new_path) or ob.exists(path=legacy_path):
-        return True
-
-    base = new_path.rsplit('.md', 1)[0]
-    suffix = 2
-    while ob.exists(path=f"{base}-{suffix}.md"):
-        return True
-
-    legacy_base = legacy_path.rsplit('.md', 1)[0]
-    suffix = 2
-    while ob.exists(path=f"{legacy_base}-{suffix}.md"):
-        return True
-
-    return False
+    # Two (cached) folder listings instead of one exists() CLI spawn per candidate
+    candidates = {new_path, legacy_path}
+    for path in (new_path, legacy_path):
+        candidates.add(f"{path.rsplit('.md', 1)[0]}-2.md")
+    listed = set(_scan_folder_files(new_path.rsplit("/", 1)[0]))
+    listed.update(_scan_folder_files(dailies_folder))
+    return not candidates.isdisjoint(listed)
 
 
 # ---------------------------------------------------------------------------
@@ -346,16 +461,18 @@ def write_file(path: str, content: str) -> None:
     if vault_root:
         full_path = Path(vault_root) / path
         full_path.parent.mkdir(parents=True, exist_ok=True)
-        full_path.write_text(content, encoding="utf-8")
+        full_path.write_bytes(content.encode("utf-8"))
         # Invalidate the in-process cache so the next read sees new content
         _file_content_cache[path] = content
     else:
         _client().create(path=path, content=content, overwrite=True)
+        _file_content_cache.pop(path, None)
 
 
 def append_to_file(path: str, content: str) -> None:
     """Append content to a vault file."""
     _client().append(content, path=path)
+    _file_content_cache.pop(path, None)  # cached text predates the append
 
 
 def file_exists(path: str) -> bool:
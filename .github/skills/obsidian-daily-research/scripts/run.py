@@ -18,6 +18,8 @@ Scheduled via Windows Task Scheduler (see schedule.ps1).
 
 import argparse
 import copy
+import functools
+import heapq
 import io
 import json
 import os
@@ -27,6 +29,7 @@ import sys
 import urllib.parse
 import urllib.request
 import xml.etree.ElementTree as ET
+from operator import itemgetter
 from types import SimpleNamespace
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
@@ -47,19 +50,18 @@ PIPELINE_MD = SKILL_DIR / "pipeline.md"
 if str(SCRIPT_DIR) not in sys.path:
     sys.path.insert(0, str(SCRIPT_DIR))
 
-# Import our own modules via direct file import (avoids 'lib' name clash)
-import importlib.util
-
-def _load_local_module(name: str, filepath: Path):
-    """Load a module from the obsidian-daily-research scripts/lib/ directory."""
-    spec = importlib.util.spec_from_file_location(name, str(filepath))
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod
-
-_local_lib = SCRIPT_DIR / "lib"
-topics_mod = _load_local_module("dr_topics", _local_lib / "topics.py")
-vault = _load_local_module("dr_vault", _local_lib / "vault_v2.py")
+# Our own modules — scripts/lib is a regular package. The vendored last30days
+# modules use relative imports, so nothing else on sys.path claims 'lib'.
+from lib import topics as topics_mod, vault_v2 as vault
+from vendor.last30days import (
+    dates,
+    dedupe,
+    env as l30_env,
+    http as l30_http,
+    normalize,
+    score,
+    xai_x,
+)
 
 # Feedback file path (relative to vault)
 
@@ -81,15 +83,17 @@ def resolve_xai_model(api_key: str, preferred: str = "grok-4-1-fast") -> str:
     _EXCLUDE = ["imagine", "image", "video", "build", "embed"]
 
     try:
-        req = urllib.request.Request(
+        # Vendored http pool: an idle api.x.ai connection left by an earlier
+        # call is reused; at startup this call usually opens the first one
+        data = l30_http.get(
             "https://api.x.ai/v1/models",
             headers={
                 "Authorization": f"Bearer {api_key}",
                 "Content-Type": "application/json",
             },
+            timeout=10,
+            retries=1,
         )
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
 
         models = data.get("data", [])
         if not models:
@@ -352,11 +356,23 @@ LAB_GROUP_MAP = {
 # past that (see xai_x.py), so must-follow handles are scanned in chunks.
 MUST_FOLLOW_BATCH_SIZE = 10
 
+# Topic scans and must-follow chunks are independent, network-bound xAI
+# searches — run a few at once. Overridable via `max_concurrency` in pipeline.md.
+MAX_CONCURRENCY = 4
+
 # Prominent Voices asks the model for 8-15 items but has averaged 5.7/day. Retry
 # below this floor instead of only on a completely empty response.
 PROMINENT_MIN_ITEMS = 8
 
 
+def _max_concurrency(config: dict) -> int:
+    """Thread-pool width for concurrent xAI searches (pipeline.md `max_concurrency`)."""
+    try:
+        return max(1, int(config.get("max_concurrency", MAX_CONCURRENCY)))
+    except (TypeError, ValueError):
+        return MAX_CONCURRENCY
+
+
 def _apply_derived_quality_filters(config: dict) -> dict:
     """Populate quality filter account lists from pipeline-defined accounts."""
     qf = copy.deepcopy(config.get("quality_filters") or DEFAULT_QUALITY_FILTERS)
@@ -530,6 +546,23 @@ def load_config() -> dict:
 # Text sanitization for markdown output
 # ---------------------------------------------------------------------------
 
+_CTRL_WS_RE = re.compile(r'[\n\r\t]+')
+_MULTI_SPACE_RE = re.compile(r' {2,}')
+
+
+@functools.lru_cache(maxsize=1024)
+def _sanitize_line(text: str) -> str:
+    """Length-independent half of _oneline, cached: the same tweet text is
+    rendered several times per run (synthesis prompt, note body, reading list)
+    at different max_len values."""
+    # Replace newlines/tabs with a space
+    t = _CTRL_WS_RE.sub(' ', text)
+    # Remove characters that break markdown link syntax or tables
+    t = t.replace('[', '').replace(']', '').replace('|', '-')
+    # Collapse multiple spaces
+    return _MULTI_SPACE_RE.sub(' ', t).strip()
+
+
 def _oneline(text: str, max_len: int = 120) -> str:
     """Collapse text to a single line safe for markdown list items and links.
 
@@ -537,12 +570,7 @@ def _oneline(text: str, max_len: int = 120) -> str:
     (break markdown links). Collapses whitespace, then truncates only when
     max_len is a positive integer.
     """
-    # Replace newlines/tabs with a space
-    t = re.sub(r'[\n\r\t]+', ' ', text)
-    # Remove characters that break markdown link syntax or tables
-    t = t.replace('[', '').replace(']', '').replace('|', '-')
-    # Collapse multiple spaces
-    t = re.sub(r' {2,}', ' ', t).strip()
+    t = _sanitize_line(text)
     if max_len and max_len > 0 and len(t) > max_len:
         return t[:max_len] + "..."
     return t
@@ -552,32 +580,73 @@ def _oneline(text: str, max_len: int = 120) -> str:
 # Quality filters — engagement floor, long-form bias, priority accounts
 # ---------------------------------------------------------------------------
 
-def _is_spam(item, config: dict, source: str = "x") -> bool:
+def _fence_words(pattern: str) -> str:
+    """Add \\b at the edges of pattern that are literal word characters.
+
+    "link in bio" no longer fires on "link in biology", and the engine can
+    reject most start offsets on the boundary test alone. Edges that are
+    already regex syntax (^, \\b, groups, classes, escapes) and patterns with
+    a '|' (where the edges belong to different branches) are left alone.
+    """
+    if not pattern or "|" in pattern:
+        return pattern
+    if pattern[0].isalnum() or pattern[0] == "_":
+        pattern = r"\b" + pattern
+    if (pattern[-1].isalnum() or pattern[-1] == "_") and pattern[-2:-1] != "\\":
+        pattern += r"\b"
+    return pattern
+
+
+@functools.lru_cache(maxsize=8)
+def _compile_spam_rules(
+    claim_rules: tuple[tuple[str, tuple[str, ...]], ...],
+    low_effort: tuple[str, ...],
+) -> tuple[list[tuple[re.Pattern, list[str]]], list[re.Pattern]]:
+    """Compile spam_detection patterns once per distinct config (not per item)."""
+    claims = [
+        (re.compile(_fence_words(claim_re), re.IGNORECASE), [d.lower() for d in link_must])
+        for claim_re, link_must in claim_rules
+        if claim_re
+    ]
+    # Low-effort bait all means the same thing — one alternation scans the
+    # text once instead of once per pattern. Patterns that can't be combined
+    # (e.g. their own inline flags) are compiled separately.
+    baits = []
+    if low_effort:
+        try:
+            baits = [re.compile("|".join(f"(?:{_fence_words(bait)})" for bait in low_effort), re.IGNORECASE)]
+        except re.error:
+            baits = [re.compile(_fence_words(bait), re.IGNORECASE) for bait in low_effort]
+    return claims, baits
+
+
+def _is_spam(
+    item,
+    claims: list[tuple[re.Pattern, list[str]]],
+    baits: list[re.Pattern],
+    source: str = "x",
+) -> bool:
     """Detect spam/misleading content using config-driven patterns.
 
     Catches:
     - Claim/link mismatch (e.g., "official Anthropic guide" linking to random GitHub)
     - Low-effort engagement bait ("follow me for more", "like and retweet")
-    """
-    spam_cfg = config.get("quality_filters", {}).get("spam_detection", {})
-    if not spam_cfg.get("enabled", False):
-        return False
 
+    claims and baits come from _compile_spam_rules, called once by the caller.
+    """
     text = (item.text if source == "x" else item.title).lower()
     url = item.url.lower()
 
     # --- Claim/link mismatch ---
-    for pattern in spam_cfg.get("claim_link_mismatch_patterns", []):
-        claim_re = pattern.get("claim_regex", "")
-        link_must = [d.lower() for d in pattern.get("link_must_contain", [])]
-        if claim_re and re.search(claim_re, text, re.IGNORECASE):
+    for claim_re, link_must in claims:
+        if claim_re.search(text):
             # The text makes a claim — does the link back it up?
             if link_must and not any(domain in url for domain in link_must):
                 return True  # Claim made but link is to a random domain
 
     # --- Low-effort engagement bait ---
-    for bait in spam_cfg.get("low_effort_patterns", []):
-        if re.search(bait, text, re.IGNORECASE):
+    for bait in baits:
+        if bait.search(text):
             return True
 
     return False
@@ -608,6 +677,10 @@ _AMPLIFIER_RE = [re.compile(p, re.IGNORECASE) for p in _AMPLIFIER_PATTERNS]
 _NOVEL_RE = [re.compile(p, re.IGNORECASE) for p in _NOVEL_ANALYSIS_SIGNALS]
 _NOVEL_ANALYSIS_MIN_CHARS = 600
 
+# Bare URL / @mention patterns shared by the quality and must-follow filters
+_TEXT_URL_RE = re.compile(r'https?://\S+')
+_MENTION_RE = re.compile(r'@\w+')
+
 
 def _is_amplifier(item) -> bool:
     """Drop tweets that only report someone else's work with no original contribution.
@@ -627,40 +700,55 @@ def _is_amplifier(item) -> bool:
     return True
 
 
-def _links_article_domain(item, article_domains: list[str]) -> bool:
+@functools.lru_cache(maxsize=8)
+def _domain_matcher(domains: tuple[str, ...]) -> re.Pattern | None:
+    """Compile lowercase domain substrings into one alternation.
+
+    A single regex scan per URL replaces the any(domain in url ...) loop
+    over every domain. Returns None when there are no domains.
+    """
+    if not domains:
+        return None
+    return re.compile("|".join(map(re.escape, domains)))
+
+
+def _links_article_domain(item, article_re: re.Pattern | None) -> bool:
     """True if the item's URL or any URL in its text points at a known article/blog domain."""
+    if article_re is None:
+        return False
     item_url = (getattr(item, 'url', '') or "").lower()
+    if article_re.search(item_url):
+        return True
     text = (getattr(item, 'text', '') or "").lower()
-    all_urls = [item_url] + re.findall(r'https?://\S+', text)
-    return any(domain in url for url in all_urls for domain in article_domains)
+    return any(article_re.search(url) for url in _TEXT_URL_RE.findall(text))
 
 
-def _classify_content(item, config: dict, source: str = "x") -> str:
+def _classify_content(
+    item,
+    handle: str,
+    lab_handles: frozenset[str],
+    long_form_min: int,
+    article_re: re.Pattern | None,
+    source: str = "x",
+) -> str:
     """Classify an item as 'deep-dive', 'lab-pulse', or 'general'.
 
     deep-dive:  Long-form threads (≥400 chars) or article links
     lab-pulse:  Posts from model providers / their lead devs
     general:    Everything else
-    """
-    qf = config.get("quality_filters", {})
-    lab_accounts = qf.get("lab_accounts", {})
-    long_form_min = qf.get("long_form_min_chars", 400)
-    article_domains = [d.lower() for d in qf.get("article_domains", [])]
-
-    # Build flat set of all lab handles
-    lab_handles = set()
-    for handles in lab_accounts.values():
-        lab_handles.update(h.lower() for h in handles)
 
+    handle is the lowercased author handle; the lookup sets are built once by
+    the caller, not once per item.
+    """
     # Lab pulse check
-    if source == "x" and item.author_handle.lower() in lab_handles:
+    if source == "x" and handle in lab_handles:
         return "lab-pulse"
 
     # Deep dive check — long threads OR posts linking to article domains
     if source == "x":
         if len(item.text) >= long_form_min:
             return "deep-dive"
-        if _links_article_domain(item, article_domains):
+        if _links_article_domain(item, article_re):
             return "deep-dive"
     return "general"
 
@@ -668,93 +756,103 @@ def _classify_content(item, config: dict, source: str = "x") -> str:
 def apply_quality_filters(result: dict, config: dict) -> dict:
     """Apply post-scoring quality filters to a topic scan result.
 
-    Five passes, all driven by DEFAULT_QUALITY_FILTERS:
-      0. Spam detection  — drop misleading/bait content
+    Five steps, all driven by DEFAULT_QUALITY_FILTERS:
+      0. Spam detection  — drop misleading/bait content (+ replies, amplifiers)
       1. Engagement floor — drop low-engagement noise
       2. Long-form bonus  — boost articles / long threads
       3. Priority accounts — boost followed accounts & frontier labs
       4. Content classify  — tag each item as deep-dive/lab-pulse/general
 
+    Each step only looks at the item itself, so all of them run in a single
+    pass over the list, in the order above.
+
     Modifies items in-place and removes filtered items from the result.
     """
     qf = config.get("quality_filters", {})
     if not qf:
         return result
 
-    # --- 0. Spam detection (remove misleading content) ---
-    result["x_items"] = [
-        item for item in result["x_items"]
-        if not _is_spam(item, config, "x")
-    ]
-
-    # --- 0b. Reply filtering (drop replies from topic scans) ---
-    # Replies leak through when the API returns them despite prompt instructions.
-    # Two checks: is_reply field from API, and text starting with @someone.
-    filtered_x = []
-    for item in result["x_items"]:
-        # Check is_reply flag (carried through from xAI response)
-        if getattr(item, 'is_reply', False):
-            continue
-        # Check text pattern: starts with @someone (but not self-mention)
-        text = item.text.strip()
-        if text.startswith("@") and not text.lower().startswith(f"@{item.author_handle.lower()}"):
-            continue
-        filtered_x.append(item)
-    result["x_items"] = filtered_x
-
-    # --- 0c. Amplifier filtering (drop "X just dropped a guide" signal-laundering) ---
-    # Exception: posts linking to a known article domain are kept — they are the
-    # primary carriers for the Deep Dives section, and "X just published..." posts
-    # that link to the actual article still have reference value.
-    _amp_article_domains = [d.lower() for d in qf.get("article_domains", [])]
-    result["x_items"] = [
-        item for item in result["x_items"]
-        if not _is_amplifier(item) or _links_article_domain(item, _amp_article_domains)
-    ]
+    article_re = _domain_matcher(tuple(d.lower() for d in qf.get("article_domains", [])))
 
     min_eng = qf.get("min_engagement", {})
     x_likes_floor = min_eng.get("x_likes", 0)
 
     long_form_bonus = qf.get("long_form_bonus", 0)
     long_form_min_chars = qf.get("long_form_min_chars", 400)
-    article_domains = [d.lower() for d in qf.get("article_domains", [])]
 
     priority = qf.get("priority_accounts", {})
     priority_x = {h.lower() for h in priority.get("x", [])}
     priority_bonus = qf.get("priority_account_bonus", 0)
 
-    # --- 1. Engagement floor (drop low-engagement items) ---
-    # Exception: priority/lab accounts bypass engagement floor
-    lab_handles = set()
-    for handles in qf.get("lab_accounts", {}).values():
-        lab_handles.update(h.lower() for h in handles)
-
-    if x_likes_floor > 0:
-        result["x_items"] = [
-            item for item in result["x_items"]
-            if item.author_handle.lower() in lab_handles  # lab accounts bypass floor
-            or item.author_handle.lower() in priority_x   # priority accounts bypass floor
+    lab_handles = frozenset(
+        h.lower() for handles in qf.get("lab_accounts", {}).values() for h in handles
+    )
+
+    # Checked and compiled once here rather than inside _is_spam for every item;
+    # None when detection is off or configures no patterns
+    spam_cfg = qf.get("spam_detection", {})
+    spam_rules = None
+    if spam_cfg.get("enabled", False):
+        claims, baits = _compile_spam_rules(
+            tuple(
+                (p.get("claim_regex", ""), tuple(p.get("link_must_contain", [])))
+                for p in spam_cfg.get("claim_link_mismatch_patterns", [])
+            ),
+            tuple(spam_cfg.get("low_effort_patterns", [])),
+        )
+        if claims or baits:
+            spam_rules = (claims, baits)
+
+    kept = []
+    for item in result["x_items"]:
+        # --- 0. Spam detection (remove misleading content) ---
+        if spam_rules and _is_spam(item, *spam_rules, "x"):
+            continue
+
+        # --- 0b. Reply filtering (drop replies from topic scans) ---
+        # Replies leak through when the API returns them despite prompt instructions.
+        # Two checks: is_reply field from API, and text starting with @someone.
+        if getattr(item, 'is_reply', False):
+            continue
+        # Check text pattern: starts with @someone (but not self-mention)
+        handle = item.author_handle.lower()
+        text = item.text.strip()
+        if text.startswith("@") and not text.lower().startswith(f"@{handle}"):
+            continue
+
+        # --- 0c. Amplifier filtering (drop "X just dropped a guide" signal-laundering) ---
+        # Exception: posts linking to a known article domain are kept — they are the
+        # primary carriers for the Deep Dives section, and "X just published..." posts
+        # that link to the actual article still have reference value.
+        if _is_amplifier(item) and not _links_article_domain(item, article_re):
+            continue
+
+        # --- 1. Engagement floor (drop low-engagement items) ---
+        # Exception: priority/lab accounts bypass engagement floor
+        if x_likes_floor > 0 and not (
+            handle in lab_handles  # lab accounts bypass floor
+            or handle in priority_x   # priority accounts bypass floor
             or (item.engagement is not None
                 and item.engagement.likes is not None
                 and item.engagement.likes >= x_likes_floor)
-        ]
+        ):
+            continue
 
-    # --- 2. Long-form content bonus ---
-    if long_form_bonus > 0:
-        for item in result["x_items"]:
-            if len(item.text) >= long_form_min_chars:
-                item.score = min(100, item.score + long_form_bonus)
+        # --- 2. Long-form content bonus ---
+        if long_form_bonus > 0 and len(item.text) >= long_form_min_chars:
+            boosted = item.score + long_form_bonus
+            item.score = 100 if boosted > 100 else boosted
 
-    # --- 3. Priority account boost ---
-    if priority_bonus > 0:
-        for item in result["x_items"]:
-            if item.author_handle.lower() in priority_x:
-                item.score = min(100, item.score + priority_bonus)
+        # --- 3. Priority account boost ---
+        if priority_bonus > 0 and handle in priority_x:
+            boosted = item.score + priority_bonus
+            item.score = 100 if boosted > 100 else boosted
 
-    # --- 4. Classify content (attach category metadata) ---
-    for item in result["x_items"]:
-        item._category = _classify_content(item, config, "x")
+        # --- 4. Classify content (attach category metadata) ---
+        item._category = _classify_content(item, handle, lab_handles, long_form_min_chars, article_re, "x")
+        kept.append(item)
 
+    result["x_items"] = kept
     return result
 
 
@@ -762,11 +860,10 @@ def run_topic_scan(
     topic: topics_mod.Topic,
     config: dict,
     l30_config: dict,
-    selected_models: dict,
     from_date: str,
     to_date: str,
-    seen_urls: set,
-    seen_titles: set,
+    seen_urls: frozenset[str],
+    seen_titles: frozenset[str],
     tracker: TokenTracker | None = None,
 ) -> dict:
     """Run a single topic scan. Returns a result dict.
@@ -774,13 +871,6 @@ def run_topic_scan(
     Uses last30days lib modules directly, at the depth configured in pipeline.md.
     """
     depth = config.get("depth", "scan")
-    from vendor.last30days import (
-        xai_x,
-        normalize,
-        score,
-        dedupe,
-        schema,
-    )
 
     result = {
         "topic": topic,
@@ -805,12 +895,12 @@ def run_topic_scan(
             if tracker:
                 tracker.record(f"X/{topic.slug}", model, _extract_usage(raw))
             items = xai_x.parse_x_response(raw)
-            normalized = normalize.normalize_x_items(items, from_date, to_date)
-            filtered = normalize.filter_by_date_range(normalized, from_date, to_date)
-            scored = score.score_x_items(filtered)
-            sorted_items = score.sort_items(scored)
-            deduped = dedupe.dedupe_x(sorted_items)
-            result["x_items"] = deduped
+            if items:  # narrow topics often come back empty — skip the no-op chain
+                normalized = normalize.normalize_x_items(items, from_date, to_date)
+                filtered = normalize.filter_by_date_range(normalized, from_date, to_date)
+                scored = score.score_x_items(filtered)
+                sorted_items = score.sort_items(scored)
+                result["x_items"] = dedupe.dedupe_x(sorted_items)
         except Exception as e:
             result["errors"].append(f"X/{topic.slug}: {e}")
 
@@ -826,40 +916,53 @@ def run_topic_scan(
     return result
 
 
-CLAUDE_CLI = r"C:\Users\nuno_\.local\bin\claude.exe"  # kept as fallback reference
-
+def _call_xai_chat(api_key: str, model: str, prompt: str, max_tokens: int = 4096, effort: str = "medium",
+                   retries: int = 1) -> tuple[str, dict | None]:
+    """Call xAI chat completions API directly. Returns (content_text, usage_dict).
 
-def _call_xai_chat(api_key: str, model: str, prompt: str, max_tokens: int = 4096, effort: str = "medium") -> tuple[str, dict | None]:
-    """Call xAI chat completions API directly. Returns (content_text, usage_dict)."""
-    payload = json.dumps({
-        "model": model,
-        "messages": [{"role": "user", "content": prompt}],
-        "max_tokens": max_tokens,
-        "temperature": 0.3,
-        "reasoning_effort": effort,
-    }).encode("utf-8")
-
-    req = urllib.request.Request(
+    Goes through the vendored http pool, so it picks up an idle keep-alive
+    connection to api.x.ai when an earlier call returned one. Single attempt by
+    default — callers with their own retry loop keep that; others pass retries.
+    """
+    data = l30_http.post(
         "https://api.x.ai/v1/chat/completions",
-        data=payload,
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
+        {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+            "temperature": 0.3,
+            "reasoning_effort": effort,
         },
+        headers={"Authorization": f"Bearer {api_key}"},
+        timeout=120,
+        retries=retries,
     )
-    with urllib.request.urlopen(req, timeout=120) as resp:
-        data = json.loads(resp.read().decode("utf-8"))
 
     content = data.get("choices", [{}])[0].get("message", {}).get("content", "")
     usage = data.get("usage")
     return content, usage
 
 
+def _strip_code_fences(text: str) -> str:
+    """Strip a leading ```/```json fence and a trailing ``` fence.
+
+    Plain string ops: the old trailing `\s*```$` regex retried the whitespace
+    run from every start position, which is quadratic on long padded output.
+    """
+    text = text.strip()
+    if text.startswith("```"):
+        text = text[3:]
+        if text.startswith("json"):
+            text = text[4:]
+        text = text.lstrip()
+    if text.endswith("```"):
+        text = text[:-3].rstrip()
+    return text
+
+
 def _extract_json_object(text: str) -> dict | None:
     """Robustly extract a JSON object from text that may contain prose or code fences."""
-    # Strip markdown code fences
-    text = re.sub(r'^```(?:json)?\s*', '', text.strip())
-    text = re.sub(r'\s*```$', '', text.strip())
+    text = _strip_code_fences(text)
     # Try direct parse first
     try:
         return json.loads(text)
@@ -1092,14 +1195,14 @@ def _filter_must_follow_substance(items: list) -> list:
     for item in items:
         text = item.text.strip()
         # Always keep if the tweet contains a non-x.com URL (sharing an article/resource)
-        urls_in_text = re.findall(r'https?://\S+', text)
+        urls_in_text = _TEXT_URL_RE.findall(text)
         external_urls = [u for u in urls_in_text if 'x.com/' not in u and 'twitter.com/' not in u]
         if external_urls:
             filtered.append(item)
             continue
         # Strip URLs and @mentions for substance check
-        clean = re.sub(r'https?://\S+', '', text)
-        clean = re.sub(r'@\w+', '', clean).strip()
+        clean = _TEXT_URL_RE.sub('', text)
+        clean = _MENTION_RE.sub('', clean).strip()
         # Check minimum length
         if len(clean) < _MF_MIN_SUBSTANCE_CHARS:
             continue
@@ -1121,6 +1224,10 @@ _ARTICLE_DOMAINS = [
     "notion.site", "dev.to", "latent.space", "cursor.com", "docs.",
 ]
 
+_ARTICLE_DOMAIN_RE = _domain_matcher(tuple(_ARTICLE_DOMAINS))
+
+_ARTICLE_URL_RE = re.compile(r'https?://[^\s\)\]"<>]+')
+
 
 def _extract_article_candidates(
     topic_results: list,
@@ -1146,12 +1253,12 @@ def _extract_article_candidates(
     def _scan(items):
         for item in items or []:
             text = getattr(item, "text", "") or ""
-            for raw in re.findall(r'https?://[^\s\)\]"<>]+', text):
+            for raw in _ARTICLE_URL_RE.findall(text):
                 url = raw.rstrip('.,;:!?)"\'')
                 low = url.lower()
                 if any(s in low for s in ("x.com/", "twitter.com/", "t.co/")):
                     continue
-                if not any(d in low for d in _ARTICLE_DOMAINS):
+                if not _ARTICLE_DOMAIN_RE.search(low):
                     continue
                 if url in seen or url in vault_urls:
                     continue
@@ -1249,14 +1356,14 @@ def auto_capture_articles(must_follow_results: list, config: dict):
         for item in result.get("items", []):
             text = item.text if hasattr(item, "text") else ""
             # Extract URLs from the tweet text
-            urls = re.findall(r'https?://\S+', text)
+            urls = _TEXT_URL_RE.findall(text)
             for url in urls:
                 # Skip X/Twitter links (those are just tweet references)
                 if "x.com/" in url or "twitter.com/" in url:
                     continue
                 # Check if it's an article domain
                 url_lower = url.lower()
-                if any(domain in url_lower for domain in _ARTICLE_DOMAINS):
+                if _ARTICLE_DOMAIN_RE.search(url_lower):
                     print(f"  [auto-capture] @{handle}: {url[:80]}")
                     try:
                         # Run linked-research via subprocess (best-effort)
@@ -1298,8 +1405,6 @@ def run_must_follow_scan(
 
     Returns a list of dicts: {handle, label, group, items: [x_item, ...]}
     """
-    from vendor.last30days import xai_x, normalize
-
     accounts = config.get("must_follow_accounts", [])
     if not accounts or not l30_config.get("XAI_API_KEY"):
         return []
@@ -1320,11 +1425,12 @@ def run_must_follow_scan(
         for i in range(0, len(lab_accounts), MUST_FOLLOW_BATCH_SIZE)
     ]
 
-    for n, chunk in enumerate(chunks, 1):
+    def scan_chunk(n: int, chunk: list) -> tuple[list, str]:
+        """Scan one chunk of handles; return (per-account results, log line)."""
         handles = [a["handle"].lstrip("@") for a in chunk]
         handle_set = {h.lower() for h in handles}
-        print(f"  [batch {n}/{len(chunks)}] {', '.join('@' + h for h in handles)}...",
-              end=" ", flush=True)
+        log = f"  [batch {n}/{len(chunks)}] {', '.join('@' + h for h in handles)}... "
+        chunk_results = []
 
         try:
             raw = xai_x.search_x_must_follow_batch(
@@ -1350,7 +1456,7 @@ def run_must_follow_scan(
                 else:
                     dropped += 1
             if dropped:
-                print(f"(dropped {dropped} wrong-author)", end=" ")
+                log += f"(dropped {dropped} wrong-author) "
 
             # Filter out replies
             final = []
@@ -1378,7 +1484,7 @@ def run_must_follow_scan(
 
             for acct in chunk:
                 clean = acct["handle"].lstrip("@").lower()
-                results.append({
+                chunk_results.append({
                     "handle": acct["handle"],
                     "label": acct.get("label", acct["handle"]),
                     "group": acct["group"],
@@ -1386,12 +1492,11 @@ def run_must_follow_scan(
                     "items": per_handle.get(clean, []),
                 })
 
-            print(f"-> {len(final)} tweets")
+            return chunk_results, log + f"-> {len(final)} tweets"
 
         except Exception as e:
-            print(f"error - {e}")
             for acct in chunk:
-                results.append({
+                chunk_results.append({
                     "handle": acct["handle"],
                     "label": acct.get("label", acct["handle"]),
                     "group": acct["group"],
@@ -1399,6 +1504,14 @@ def run_must_follow_scan(
                     "items": [],
                     "error": str(e),
                 })
+            return chunk_results, log + f"error - {e}"
+
+    # Chunks are independent xAI calls — run them concurrently, then report
+    # and collect in chunk order so output matches a sequential run.
+    with ThreadPoolExecutor(max_workers=max(1, min(_max_concurrency(config), len(chunks)))) as pool:
+        for chunk_results, log in pool.map(scan_chunk, range(1, len(chunks) + 1), chunks):
+            print(log, flush=True)
+            results.extend(chunk_results)
 
     return results
 
@@ -1430,8 +1543,6 @@ def run_prominent_ai_scan(
 
     Returns a list of XItem objects (already filtered for quality).
     """
-    from vendor.last30days import xai_x, normalize, score, dedupe
-
     if not l30_config.get("XAI_API_KEY"):
         return []
 
@@ -1534,36 +1645,6 @@ def run_prominent_ai_scan(
         return []
 
 
-# ---------------------------------------------------------------------------
-# Feedback Processing (#good / #bad tags)
-# ---------------------------------------------------------------------------
-
-# ---------------------------------------------------------------------------
-# Feedback Analysis & Proposals
-# ---------------------------------------------------------------------------
-
-# Canonical bad-reason buckets with regex patterns for classification
-_BAD_REASON_BUCKETS = [
-    ("reply",       [r"reply", r"not\s+an?\s+OP", r"not\s+original", r"response\s+to"]),
-    ("low-engagement", [r"low\s+(?:like|engagement)", r"\d+\s+likes?", r"no\s+likes", r"low\s+quality"]),
-    ("bot",         [r"bot", r"generated", r"obviously\s+(?:written\s+)?by\s+(?:a\s+)?(?:bot|AI|LLM)", r"spam"]),
-    ("self-promo",  [r"promo", r"promoting\s+(?:their|his|her)", r"shill", r"github\s+repo", r"plug"]),
-    ("misleading",  [r"mislead", r"fake", r"clickbait", r"bait", r"claim.*mismatch"]),
-    ("off-topic",   [r"off.?topic", r"irrelevant", r"not\s+related", r"wrong\s+topic"]),
-    ("duplicate",   [r"duplicate", r"already\s+seen", r"repeat", r"dupe"]),
-    ("stale",       [r"old", r"stale", r"outdated", r"not\s+new"]),
-]
-
-# Good-reason buckets for positive signal classification
-_GOOD_REASON_BUCKETS = [
-    ("long-form",     [r"long.?form", r"deep\s+dive", r"thread", r"detailed", r"comprehensive"]),
-    ("original-research", [r"original", r"research", r"paper", r"arxiv", r"novel"]),
-    ("practical",     [r"practical", r"tutorial", r"how.?to", r"example", r"code", r"implementation"]),
-    ("insider",       [r"insider", r"first.?hand", r"from\s+(?:the\s+)?team", r"official", r"announcement"]),
-    ("high-signal",   [r"signal", r"insight", r"important", r"breaking", r"major"]),
-]
-
-
 # ---------------------------------------------------------------------------
 # Self-Healing Pipeline — 4 levels of automatic recovery
 # ---------------------------------------------------------------------------
@@ -1612,19 +1693,17 @@ def detect_drift(config: dict, lookback_days: int = 30) -> list[dict]:
     just produced items reads as a false alarm otherwise.
     """
     warnings = []
-    vault_path = Path(config.get("vault_path", ""))
-    dailies_folder = config.get("dailies_folder", "Research/Dailies")
 
-    # Collect frontmatter metrics from recent notes (newest first)
+    # Collect frontmatter metrics from recent notes (newest first). Reads go
+    # through the vault file cache — the dedup scan has already loaded them.
     metrics_history = []
+    now = datetime.now()
     for i in range(1, lookback_days + 1):
-        date = (datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d")
-        year, month = date[:4], date[5:7]
-        note_path = vault_path / dailies_folder / year / month / f"{date}.md"
-        if not note_path.exists():
+        date = (now - timedelta(days=i)).strftime("%Y-%m-%d")
+        text = vault.read_daily_note(config, date)
+        if not text:
             continue
         try:
-            text = note_path.read_text(encoding="utf-8")
             fm = {}
             if text.startswith("---"):
                 end = text.find("---", 3)
@@ -2002,6 +2081,9 @@ def _find_vault_connections(topic_slugs: list[str], config: dict) -> dict[str, l
 # Google News RSS
 # ---------------------------------------------------------------------------
 
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_MULTI_WS_RE = re.compile(r"\s{2,}")
+
 
 def _fetch_google_news_topic(query: str, max_items: int = 10, max_age_days: int = 7) -> list:
     """Fetch Google News RSS for a single query. Returns list of article dicts.
@@ -2013,39 +2095,45 @@ def _fetch_google_news_topic(query: str, max_items: int = 10, max_age_days: int
     cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
     try:
         req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            xml_data = resp.read()
-        root = ET.fromstring(xml_data)
         items = []
-        for item_el in root.findall(".//item")[:max_items * 2]:  # fetch extra to compensate for date filter
-            title = item_el.findtext("title", "").strip()
-            link = item_el.findtext("link", "").strip()
-            pub_date = item_el.findtext("pubDate", "").strip()
-            source_el = item_el.find("source")
-            source = source_el.text.strip() if source_el is not None else ""
-            raw_desc = item_el.findtext("description", "")
-            description = re.sub(r"<[^>]+>", " ", raw_desc).strip()
-            description = re.sub(r"\s{2,}", " ", description)[:200]
-
-            # Date filter: only keep items from the last max_age_days
-            try:
-                dt = datetime.strptime(pub_date, "%a, %d %b %Y %H:%M:%S %Z")
-                dt = dt.replace(tzinfo=timezone.utc)
-                if dt < cutoff:
+        scanned = 0
+        with urllib.request.urlopen(req, timeout=10) as resp:
+            # Stream-parse: stop reading the feed once enough <item>s are seen
+            for _event, item_el in ET.iterparse(resp):
+                if item_el.tag != "item":
                     continue
-            except ValueError:
-                pass  # keep items with unparseable dates
-
-            items.append({
-                "title": title,
-                "url": link,
-                "source": source,
-                "pub_date": pub_date,
-                "description": description,
-                "query": query,
-            })
-            if len(items) >= max_items:
-                break
+                scanned += 1
+                if scanned > max_items * 2:  # fetch extra to compensate for date filter
+                    break
+                title = item_el.findtext("title", "").strip()
+                link = item_el.findtext("link", "").strip()
+                pub_date = item_el.findtext("pubDate", "").strip()
+                source_el = item_el.find("source")
+                source = source_el.text.strip() if source_el is not None else ""
+                raw_desc = item_el.findtext("description", "")
+                description = _HTML_TAG_RE.sub(" ", raw_desc).strip()
+                description = _MULTI_WS_RE.sub(" ", description)[:200]
+                item_el.clear()  # fields extracted — free the subtree
+
+                # Date filter: only keep items from the last max_age_days
+                try:
+                    dt = datetime.strptime(pub_date, "%a, %d %b %Y %H:%M:%S %Z")
+                    dt = dt.replace(tzinfo=timezone.utc)
+                    if dt < cutoff:
+                        continue
+                except ValueError:
+                    pass  # keep items with unparseable dates
+
+                items.append({
+                    "title": title,
+                    "url": link,
+                    "source": source,
+                    "pub_date": pub_date,
+                    "description": description,
+                    "query": query,
+                })
+                if len(items) >= max_items:
+                    break
         return items
     except Exception as e:
         print(f"  [news] Error fetching '{query}': {e}")
@@ -2078,9 +2166,7 @@ def _score_news_with_llm(items: list, api_key: str = "", model: str = "grok-4.5"
 
     def _parse_news_rankings(content: str) -> list:
         """Parse JSON array of news rankings from LLM output."""
-        content = content.strip()
-        content = re.sub(r"^```(?:json)?\s*", "", content)
-        content = re.sub(r"\s*```$", "", content)
+        content = _strip_code_fences(content)
         first_bracket = content.find('[')
         last_bracket = content.rfind(']')
         if first_bracket >= 0 and last_bracket > first_bracket:
@@ -2115,7 +2201,7 @@ def _score_news_with_llm(items: list, api_key: str = "", model: str = "grok-4.5"
 
     # Fall back to xAI API
     try:
-        content, usage = _call_xai_chat(api_key, model, prompt, max_tokens=2048, effort="low")
+        content, usage = _call_xai_chat(api_key, model, prompt, max_tokens=2048, effort="low", retries=2)
         # Record it — this path is billable and used to be invisible in the
         # cost report, which understated every run where the CLI hiccuped.
         if tracker and usage:
@@ -2162,6 +2248,19 @@ def _news_title_strip_outlet(title: str) -> str:
     return re.sub(r"\s+-\s+[^-]+$", "", (title or "").strip())
 
 
+def _fetch_google_news_queries(queries: list[str]) -> list[list]:
+    """Fetch several Google News RSS queries concurrently; results keep query order.
+
+    Each fetch is a blocking HTTP round-trip with no shared state, so they
+    overlap cleanly. Dedup (_accept) stays sequential in the caller.
+    """
+    if not queries:
+        return []
+    with ThreadPoolExecutor(max_workers=min(8, len(queries))) as pool:
+        return list(pool.map(
+            lambda q: _fetch_google_news_topic(q, max_items=10, max_age_days=7), queries))
+
+
 def fetch_google_news(topics: list, config: dict, api_key: str = "", model: str = "grok-4.5",
                       tracker: TokenTracker | None = None,
                       vault_only_urls: set | None = None,
@@ -2198,21 +2297,21 @@ def fetch_google_news(topics: list, config: dict, api_key: str = "", model: str
         seen_run_titles.add(key)
         return True
 
-    for topic in topics:
-        # Only append "AI" when the display name doesn't already say it, or
-        # topics like "Software development lifecycle & AI" search for
-        # "... & AI AI" and match badly.
-        name = topic.display_name
-        query = name if re.search(r"\bAI\b", name) else f"{name} AI"
-        items = _fetch_google_news_topic(query, max_items=10, max_age_days=7)
+    # Only append "AI" when the display name doesn't already say it, or
+    # topics like "Software development lifecycle & AI" search for
+    # "... & AI AI" and match badly.
+    queries = [
+        name if re.search(r"\bAI\b", name) else f"{name} AI"
+        for name in (topic.display_name for topic in topics)
+    ]
+    for topic, items in zip(topics, _fetch_google_news_queries(queries)):
         kept = [it for it in items if _accept(it)]
         all_items.extend(kept)
         print(f"  [news/{topic.slug}] {len(items)} articles, {len(kept)} new (last 7 days)")
 
     if not all_items:
         # Nothing from topics — try general queries directly
-        for gq in _GENERAL_AI_QUERIES:
-            items = _fetch_google_news_topic(gq, max_items=10, max_age_days=7)
+        for gq, items in zip(_GENERAL_AI_QUERIES, _fetch_google_news_queries(_GENERAL_AI_QUERIES)):
             kept = [it for it in items if _accept(it)]
             all_items.extend(kept)
             print(f"  [news/general] {len(items)} articles, {len(kept)} new for '{gq}'")
@@ -2227,8 +2326,7 @@ def fetch_google_news(topics: list, config: dict, api_key: str = "", model: str
         shortfall = 10 - len(scored)
         print(f"  [news] Only {len(scored)} topic items — backfilling {shortfall} from general AI news...")
         backfill_items = []
-        for gq in _GENERAL_AI_QUERIES:
-            items = _fetch_google_news_topic(gq, max_items=10, max_age_days=7)
+        for items in _fetch_google_news_queries(_GENERAL_AI_QUERIES):
             backfill_items.extend(it for it in items if _accept(it))
         if backfill_items:
             extra_scored = _score_news_with_llm(backfill_items, api_key=api_key,
@@ -2498,37 +2596,40 @@ def _lab_handle_set(config: dict, org_only: bool = False, people_only: bool = Fa
 def _build_reading_list(topic_results: list, config: dict) -> list:
     """Build a merged, ranked reading list across all topics."""
     max_items = config.get("reading_list_max", 15)
-    all_items = []
     lab_handles = _lab_handle_set(config)
 
-    for tr in topic_results:
-        topic = tr["topic"]
-        for item in tr["x_items"]:
-            if item.author_handle.lower().lstrip("@") in lab_handles:
-                continue  # covered by the Lab Pulse rollup
-            all_items.append({
-                "title": _oneline(item.text, 80),
-                "url": item.url,
-                # `author` is the actual handle. The old `summary` field held
-                # `why_relevant` — LLM justification prose — but rendered under a
-                # column headed "Author", which is what it looked like to readers.
-                "author": f"@{item.author_handle}",
-                "summary": item.why_relevant or f"@{item.author_handle}",
-                "topic_slug": topic.slug,
-                "score": item.score * topic.weight,
-                "source": "x",
-            })
+    candidates = (
+        (item.score * topic.weight, item, topic)
+        for tr in topic_results
+        for topic in (tr["topic"],)
+        for item in tr["x_items"]
+        if item.author_handle.lower().lstrip("@") not in lab_handles  # covered by the Lab Pulse rollup
+    )
 
-    # Sort by weighted score descending
-    all_items.sort(key=lambda x: x["score"], reverse=True)
-    return all_items[:max_items]
+    # Top-N by weighted score descending (nlargest is stable, like sorted()),
+    # then build row dicts only for the survivors
+    rows = []
+    for weighted, item, topic in heapq.nlargest(max_items, candidates, key=itemgetter(0)):
+        author = f"@{item.author_handle}"
+        rows.append({
+            "title": _oneline(item.text, 80),
+            "url": item.url,
+            # `author` is the actual handle. The old `summary` field held
+            # `why_relevant` — LLM justification prose — but rendered under a
+            # column headed "Author", which is what it looked like to readers.
+            "author": author,
+            "summary": item.why_relevant or author,
+            "topic_slug": topic.slug,
+            "score": weighted,
+            "source": "x",
+        })
+    return rows
 
 
 def _format_date(date_str: str) -> str:
     """Format YYYY-MM-DD as 'Feb 23, 2026'."""
     try:
-        dt = datetime.strptime(date_str, "%Y-%m-%d")
-        return dt.strftime("%b %d, %Y")
+        return datetime.fromisoformat(date_str).strftime("%b %d, %Y")
     except ValueError:
         return date_str
 
@@ -2571,11 +2672,16 @@ def _setup_run_logging() -> Path | None:
     logs_dir = SKILL_DIR / "logs"
     try:
         logs_dir.mkdir(exist_ok=True)
-        for old in logs_dir.glob("daily-research-*.log"):
-            age_days = (datetime.now() - datetime.fromtimestamp(old.stat().st_mtime)).days
-            if age_days > 30:
-                old.unlink()
-        log_path = logs_dir / f"daily-research-{datetime.now().strftime('%Y-%m-%d_%H%M%S')}.log"
+        now = datetime.now()
+        # Older than 30 whole days; one scandir pass, one clock read
+        cutoff = now.timestamp() - 31 * 86400
+        with os.scandir(logs_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if (name.startswith("daily-research-") and name.endswith(".log")
+                        and entry.stat().st_mtime <= cutoff):
+                    os.unlink(entry.path)
+        log_path = logs_dir / f"daily-research-{now.strftime('%Y-%m-%d_%H%M%S')}.log"
         logfile = open(log_path, "w", encoding="utf-8", errors="replace")
     except OSError:
         return None
@@ -2626,15 +2732,17 @@ def main():
 
     # Load config
     config = load_config()
-    today = datetime.now().strftime("%Y-%m-%d")
+    now = datetime.now()  # single clock read — all run date windows derive from it
+    today = now.strftime("%Y-%m-%d")
     note_date_key = today + args.note_suffix  # used for filename; today kept for dedup/date logic
 
     # --show-dedup: just dump URLs and exit
     if args.show_dedup:
         seen = vault.load_seen_urls(config)
         print(f"Seen URLs in vault: {len(seen)}")
-        for url in sorted(seen):
-            print(f"  {url}")
+        if seen:
+            # One write instead of a print per URL (each goes through the Tee/UTF-8 wrappers)
+            sys.stdout.write("".join(f"  {url}\n" for url in sorted(seen)))
         return
 
     # Enable debug
@@ -2645,7 +2753,6 @@ def main():
         print(f"[skip] Daily research note already exists for {today}. Use --force-rerun to run again intentionally.")
         return
 
-    from vendor.last30days import env as l30_env
     l30_config = l30_env.get_config()
 
     # (#keep → Library promote pass removed. Research/Library is still written by
@@ -2667,28 +2774,24 @@ def main():
 
     # Load vault dedup set (zero tokens — pure filesystem, single pass)
     print(f"[dedup] Scanning vault for seen URLs and titles...")
-    seen_urls, seen_titles = vault.load_seen_dedup(config)
-    print(f"[dedup] Found {len(seen_urls)} seen URLs, {len(seen_titles)} seen titles")
+    vault_only_urls, seen_titles = vault.load_seen_dedup(config)
+    print(f"[dedup] Found {len(vault_only_urls)} seen URLs, {len(seen_titles)} seen titles")
 
-    # Save vault-only URLs before scanning adds to the set (used by prominent AI dedup)
-    vault_only_urls = set(seen_urls)
+    # vault_only_urls stays the frozen vault snapshot (used by prominent AI dedup);
+    # seen_urls grows as scans claim URLs
+    seen_urls = set(vault_only_urls)
 
     # Date range: last 7 days for daily scan (not 30)
-    from vendor.last30days import dates
     from_date, _ = dates.get_date_range(7)
     to_date = today
 
     # Must-follow: always last 24 hours only
-    mf_from_date = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+    mf_from_date = (now - timedelta(days=1)).strftime("%Y-%m-%d")
 
     # Prominent voices: last 48 hours — a 24h window plus vault dedup starved
     # the section (viral tweets found yesterday get deduped, and too few new
     # ones cross the like floor within a single day). Dedup handles repeats.
-    prom_from_date = (datetime.now() - timedelta(days=2)).strftime("%Y-%m-%d")
-
-    # Select models (reuse last30days model selection with caching)
-    from vendor.last30days import models as l30_models
-    selected_models = l30_models.get_models(l30_config)
+    prom_from_date = (now - timedelta(days=2)).strftime("%Y-%m-%d")
 
     # Auto-resolve xAI model: check API for latest available
     configured_xai = l30_config.get("xai_model") or config.get("xai_model", "grok-4-1-fast")
@@ -2715,26 +2818,33 @@ def main():
     # Initialize token tracker
     tracker = TokenTracker(config.get("cost_rates"))
 
-    # Run topic scans sequentially (to stay within rate limits)
+    # Run topic scans concurrently (a small pool keeps us within rate limits).
+    # Each scan dedups against the vault only; cross-topic dedup happens below,
+    # in topic order, so results match a sequential run.
     print(f"\n[scan] Starting {len(all_topics)} topic scans (scan mode)...")
     topic_results = []
     total_errors = []
 
-    for topic in all_topics:
-        print(f"  [{topic.slug}] Scanning...", end=" ", flush=True)
-        result = run_topic_scan(
-            topic, config, l30_config, selected_models,
-            from_date, to_date, seen_urls, seen_titles,
-            tracker=tracker,
-        )
+    with ThreadPoolExecutor(max_workers=max(1, min(_max_concurrency(config), len(all_topics)))) as pool:
+        scans = list(pool.map(
+            lambda t: run_topic_scan(
+                t, config, l30_config,
+                from_date, to_date, vault_only_urls, seen_titles,
+                tracker=tracker,
+            ),
+            all_topics,
+        ))
+
+    for topic, result in zip(all_topics, scans):
+        # Drop URLs an earlier topic already claimed, then claim this topic's
+        result["x_items"] = [item for item in result["x_items"] if item.url not in seen_urls]
         x_count = len(result["x_items"])
-        print(f"-> {x_count}X items (new)")
+        print(f"  [{topic.slug}] -> {x_count}X items (new)")
         topic_results.append(result)
         total_errors.extend(result["errors"])
 
         # Add found URLs to seen set to dedup across topics
-        for item in result["x_items"]:
-            seen_urls.add(item.url)
+        seen_urls.update(item.url for item in result["x_items"])
 
     # Show errors if any
     if total_errors:
@@ -2782,8 +2892,7 @@ def main():
                 vault_only_urls=vault_only_urls,
             )
             # Add to seen_urls so synthesis doesn't double-count
-            for item in prominent_results:
-                seen_urls.add(item.url)
+            seen_urls.update(item.url for item in prominent_results)
         except Exception as e:
             print(f"[heal] Prominent AI scan failed ({e}) — continuing without it")
 